@@ -1,5 +1,7 @@
 import streamlit as st
-import json
+import io
+import numpy as np
+import orjson
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
@@ -15,7 +17,7 @@ st.set_page_config(
 )
 
 # Estilos customizados
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -45,7 +47,62 @@ st.markdown("""
         margin: 1rem 0;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Colunas exibidas nas tabelas (campo do JSON -> rótulo)
+UNTAGGED_COLUMNS = {
+    'instance_id': 'Instance ID',
+    'name': 'Nome',
+    'region': 'Região',
+    'state': 'Estado',
+    'instance_type': 'Tipo'
+}
+TAG_STATUS_COLUMNS = {
+    'name': 'Name Tag',
+    'owner': 'Owner Tag',
+    'cost_center': 'CostCenter Tag',
+    'environment': 'Environment Tag'
+}
+STOPPED_COLUMNS = {
+    'instance_id': 'Instance ID',
+    'name': 'Nome',
+    'region': 'Região',
+    'instance_type': 'Tipo',
+    'owner': 'Owner',
+    'cost_center': 'CostCenter',
+    'environment': 'Environment'
+}
+VOLUME_COLUMNS = {
+    'volume_id': 'Volume ID',
+    'region': 'Região',
+    'size': 'Tamanho (GB)',
+    'volume_type': 'Tipo'
+}
+EIP_COLUMNS = {
+    'allocation_id': 'Allocation ID',
+    'public_ip': 'Public IP',
+    'region': 'Região'
+}
+INSTANCE_COLUMNS = {
+    'instance_id': 'Instance ID',
+    'name': 'Nome',
+    'region': 'Região',
+    'state': 'Estado',
+    'instance_type': 'Tipo',
+    'os': 'OS',
+    'owner': 'Owner',
+    'cost_center': 'CostCenter',
+    'environment': 'Environment',
+    'vpc_id': 'VPC ID',
+    'private_ip': 'IP Privado',
+    'public_ip': 'IP Público'
+}
+
+# Colunas de baixa cardinalidade armazenadas como category
+CATEGORY_COLUMNS = ['region', 'state', 'instance_type', 'environment', 'cost_center', 'owner', 'vpc_id']
+
+# Limite de linhas enviadas ao navegador na tabela de instâncias
+MAX_TABLE_ROWS = 1000
 
 # Carregar dados
 @st.cache_data(ttl=300)
@@ -64,14 +121,384 @@ def load_data():
         return None
     
     try:
-        with open(data_file, 'r') as f:
-            data = json.load(f)
+        data = orjson.loads(data_file.read_bytes())
         return data
     except Exception as e:
         st.error(f"Erro ao carregar dados: {e}")
         return None
 
+def flatten_section(regions, section, key, columns):
+    """Achata regions[*][section][key] em um DataFrame (tipos pyarrow) garantindo as colunas esperadas"""
+    regions = [region_data for region_data in regions if region_data.get(section, {}).get(key)]
+    df = pd.DataFrame()
+    if regions:
+        df = pd.json_normalize(
+            regions, record_path=[section, key], meta=['region'], meta_prefix='_', errors='ignore'
+        )
+        # A região da seção prevalece sobre a registrada em cada item
+        df['region'] = df.pop('_region').fillna('unknown')
+    df = df.convert_dtypes(dtype_backend='pyarrow')
+    missing = [col for col in columns if col not in df]
+    return df.reindex(columns=[*df.columns, *missing]).astype({col: 'string[pyarrow]' for col in missing})
+
+def resolve_os(df):
+    """Usa 'platform' como sistema operacional quando 'os' não foi coletado"""
+    if 'platform' in df:
+        df['os'] = df['os'].fillna(df['platform'])
+    return df
+
+# Agregar dados por região
+@st.cache_data(ttl=300)
+def aggregate_data(collection_timestamp, _data):
+    """Agrega os dados de todas as regiões em DataFrames (refeito apenas a cada nova coleta)"""
+    regions = _data.get('regions', [])
+    
+    df_instances = resolve_os(flatten_section(regions, 'instances', 'details', INSTANCE_COLUMNS))
+    # Normalizar estado para lowercase
+    df_instances['state'] = df_instances['state'].str.lower()
+    df_instances['cost_center'] = df_instances['cost_center'].replace('', 'N/A')
+    for col in CATEGORY_COLUMNS:
+        df_instances[col] = df_instances[col].fillna('N/A').astype('category')
+    
+    df_volumes = flatten_section(regions, 'unused_volumes', 'details', VOLUME_COLUMNS)
+    df_volumes['size'] = pd.to_numeric(df_volumes['size'], errors='coerce', downcast='unsigned')
+    
+    # Instâncias paradas - usar filtro direto nas instâncias
+    df_stopped = df_instances.loc[df_instances['state'].eq('stopped')].reset_index(drop=True)
+    
+    df_untagged = flatten_section(
+        regions, 'untagged_resources', 'instances', {**UNTAGGED_COLUMNS, **TAG_STATUS_COLUMNS}
+    )
+    df_untagged['state'] = df_untagged['state'].str.lower()
+    
+    return (
+        df_instances,
+        df_untagged,
+        df_stopped,
+        df_volumes,
+        flatten_section(regions, 'unused_eips', 'details', EIP_COLUMNS)
+    )
+
+def count_missing_tag(df, column):
+    """Conta as instâncias sem a tag informada (ausente ou 'N/A')"""
+    if column not in df:
+        return len(df)
+    return int((df[column].isna() | df[column].eq('N/A')).sum())
+
+# Exportações (geradas uma vez por coleta)
+@st.cache_data(ttl=300)
+def instances_csv(collection_timestamp, _df):
+    """Serializa as instâncias em CSV"""
+    buffer = io.BytesIO()
+    _df.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+@st.cache_data(ttl=300)
+def full_json(collection_timestamp, _data):
+    """Serializa os dados completos da coleta em JSON"""
+    return orjson.dumps(_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+def build_table(df, columns, mask=None):
+    """Projeta as colunas do DataFrame com os rótulos de exibição"""
+    if mask is not None:
+        df = df.loc[mask]
+    table = df[list(columns)].rename(columns=columns)
+    text_columns = table.select_dtypes(include=['string', 'object']).columns
+    table[text_columns] = table[text_columns].fillna('N/A')
+    return table
+
+def top_k_with_other(counts, k=10):
+    """Mantém as k maiores contagens e agrupa o restante em 'Outros'"""
+    if len(counts) <= k:
+        return counts
+    return pd.concat([counts.head(k), pd.Series({'Outros': counts.iloc[k:].sum()})])
+
+@st.cache_data(ttl=300)
+def get_filter_options(collection_timestamp, _df):
+    """Opções dos filtros, lidas das categorias (refeito apenas a cada nova coleta)"""
+    return {
+        'region': _df['region'].cat.categories.tolist(),
+        'environment': _df['environment'].cat.categories.drop('N/A', errors='ignore').tolist(),
+        'owner': _df['owner'].cat.categories.drop('N/A', errors='ignore').tolist()
+    }
+
+def inject_css():
+    """Aplica os estilos customizados (reenviados a cada rerun, senão o Streamlit os remove)"""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Gráficos (gerados uma vez por coleta)
+@st.cache_data(ttl=300)
+def region_bar_fig(collection_timestamp, _df):
+    """Gráfico de instâncias em execução/paradas por região"""
+    # Contagem por região/estado em uma única operação vetorizada
+    region_stats = _df.groupby(['region', 'state'], observed=True).size().unstack(fill_value=0)
+    # Ordenar por total para melhor visualização
+    totals = region_stats.sum(axis=1).sort_values(ascending=False)
+    region_stats = region_stats.reindex(index=totals.index, columns=['running', 'stopped'], fill_value=0)
+    regions = region_stats.index.astype(str).to_numpy()
+    
+    fig = go.Figure([
+        go.Bar(name='Em Execução', x=regions, y=region_stats['running'].to_numpy(), marker_color='#00cc00'),
+        go.Bar(name='Paradas', x=regions, y=region_stats['stopped'].to_numpy(), marker_color='#ff4444')
+    ])
+    # Rotacionar labels do eixo X para melhor visualização
+    fig.update_xaxes(tickangle=-45)
+    fig.update_layout(
+        title="Distribuição de Instâncias por Região",
+        barmode='stack',
+        xaxis_title="Região AWS",
+        yaxis_title="Quantidade de Instâncias",
+        legend_title="Status"
+    )
+    return fig
+
+@st.cache_data(ttl=300)
+def instance_types_fig(collection_timestamp, _df):
+    """Gráfico dos tipos de instância mais usados"""
+    instance_types = top_k_with_other(_df['instance_type'].value_counts())
+    df_types = pd.DataFrame({'Tipo': instance_types.index, 'Quantidade': instance_types.values})
+    return px.pie(
+        df_types, 
+        values='Quantidade', 
+        names='Tipo',
+        title="Top 10 Tipos de Instâncias"
+    )
+
+@st.cache_data(ttl=300)
+def environment_fig(collection_timestamp, _df):
+    """Gráfico de instâncias por Environment"""
+    env_counts = _df['environment'].value_counts()
+    df_env = pd.DataFrame({'Environment': env_counts.index, 'Quantidade': env_counts.values})
+    return px.bar(df_env, x='Environment', y='Quantidade', 
+                  title="Instâncias por Environment")
+
+@st.cache_data(ttl=300)
+def cost_center_fig(collection_timestamp, _df):
+    """Gráfico dos CostCenters com mais instâncias"""
+    # value_counts já ordena por quantidade de forma decrescente
+    cc_counts = top_k_with_other(_df['cost_center'].value_counts())
+    df_cc = pd.DataFrame({'CostCenter': cc_counts.index, 'Quantidade': cc_counts.values})
+    # Converter CostCenter para string para garantir que os labels sejam exibidos corretamente
+    df_cc['CostCenter'] = df_cc['CostCenter'].astype(str)
+    fig = px.bar(
+        df_cc, 
+        x='CostCenter', 
+        y='Quantidade',
+        title="Top 10 CostCenters",
+        labels={'CostCenter': 'Cost Center', 'Quantidade': 'Quantidade de Instâncias'}
+    )
+    fig.update_xaxes(tickangle=-45)
+    fig.update_layout(
+        xaxis_title="Cost Center",
+        yaxis_title="Quantidade de Instâncias"
+    )
+    return fig
+
+@st.cache_data(ttl=300)
+def owner_fig(collection_timestamp, _df):
+    """Gráfico de instâncias por Owner"""
+    owner_counts = top_k_with_other(_df['owner'].value_counts())
+    df_owner = pd.DataFrame({'Owner': owner_counts.index, 'Quantidade': owner_counts.values})
+    return px.pie(df_owner, values='Quantidade', names='Owner',
+                  title="Instâncias por Owner")
+
+# TAB 1: Overview
+@st.fragment
+def render_overview_tab(collection_timestamp, df_all):
+    """Renderiza a aba de visão geral"""
+    st.header("Visão Geral")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Instâncias por Região")
+        if not df_all.empty:
+            st.plotly_chart(region_bar_fig(collection_timestamp, df_all), use_container_width=True, key="regions_bar")
+        else:
+            st.info("Nenhuma região encontrada com instâncias.")
+    
+    with col2:
+        st.subheader("Tipos de Instâncias")
+        if not df_all.empty:
+            st.plotly_chart(instance_types_fig(collection_timestamp, df_all), use_container_width=True, key="types_pie")
+
+# TAB 2: Tagging Compliance
+@st.fragment
+def render_tagging_tab(df_all, df_untagged_all):
+    """Renderiza a aba de tagging compliance"""
+    st.header("🏷️ Tagging Compliance")
+    
+    if not df_untagged_all.empty:
+        st.markdown('<div class="warning-box">⚠️ Existem recursos sem tags obrigatórias!</div>', unsafe_allow_html=True)
+    
+        # Análise de tags ausentes
+        missing_tags_analysis = {
+            'Sem Name': count_missing_tag(df_all, 'tags.Name'),
+            'Sem Owner': count_missing_tag(df_all, 'tags.owner'),
+            'Sem CostCenter': count_missing_tag(df_all, 'tags.CostCenter'),
+            'Sem Environment': count_missing_tag(df_all, 'tags.Environment')
+        }
+    
+        cols = st.columns(4)
+        for idx, (tag_type, missing_count) in enumerate(missing_tags_analysis.items()):
+            with cols[idx]:
+                st.metric(tag_type, missing_count)
+    
+        # Tabela de recursos não taggeados
+        st.subheader("Recursos Sem Tags Obrigatórias")
+        tag_values = df_untagged_all[list(TAG_STATUS_COLUMNS)].fillna('N/A')
+        df_untagged = build_table(df_untagged_all, UNTAGGED_COLUMNS).assign(**{
+            label: np.where(tag_values[field].eq('N/A'), '❌', '✅')
+            for field, label in TAG_STATUS_COLUMNS.items()
+        })
+        st.dataframe(df_untagged, use_container_width=True, hide_index=True)
+    else:
+        st.success("✅ Todos os recursos estão devidamente taggeados!")
+
+# TAB 3: Cost Optimization
+@st.fragment
+def render_cost_tab(df_stopped_all, df_volumes_all, df_eips_all):
+    """Renderiza a aba de otimização de custos"""
+    st.header("💰 Cost Optimization Opportunities")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🛑 Instâncias Paradas")
+        if not df_stopped_all.empty:
+            st.warning(f"⚠️ {len(df_stopped_all)} instâncias paradas encontradas")
+            df_stopped = build_table(df_stopped_all, STOPPED_COLUMNS)
+            st.dataframe(df_stopped, use_container_width=True, hide_index=True)
+        else:
+            st.success("✅ Nenhuma instância parada encontrada")
+    
+    with col2:
+        st.subheader("💾 Volumes Não Utilizados")
+        if not df_volumes_all.empty:
+            df_volumes = build_table(df_volumes_all, VOLUME_COLUMNS)
+            total_size = df_volumes_all['size'].sum()
+            st.warning(f"⚠️ {len(df_volumes_all)} volumes não utilizados ({total_size:g} GB)")
+            st.dataframe(df_volumes, use_container_width=True, hide_index=True)
+        else:
+            st.success("✅ Nenhum volume não utilizado encontrado")
+    
+    st.subheader("🌐 Elastic IPs Não Utilizados")
+    if not df_eips_all.empty:
+        st.warning(f"⚠️ {len(df_eips_all)} EIPs não utilizados")
+        df_eips = build_table(df_eips_all, EIP_COLUMNS)
+        st.dataframe(df_eips, use_container_width=True, hide_index=True)
+    else:
+        st.success("✅ Nenhum EIP não utilizado encontrado")
+
+# TAB 4: Instâncias
+@st.fragment
+def render_instances_tab(collection_timestamp, df_all):
+    """Renderiza a aba de instâncias com os filtros"""
+    st.header("🖥️ Detalhes das Instâncias")
+    
+    # Filtros
+    filter_options = get_filter_options(collection_timestamp, df_all)
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        selected_region = st.selectbox(
+            "Filtrar por Região",
+            ['Todas'] + filter_options['region']
+        )
+    
+    with col2:
+        selected_state = st.selectbox(
+            "Filtrar por Estado",
+            ['Todos', 'running', 'stopped', 'terminated']
+        )
+    
+    with col3:
+        selected_environment = st.selectbox(
+            "Filtrar por Environment",
+            ['Todos'] + filter_options['environment']
+        )
+    
+    with col4:
+        selected_owner = st.selectbox(
+            "Filtrar por Owner",
+            ['Todos'] + filter_options['owner']
+        )
+    
+    # Aplicar filtros
+    mask = pd.Series(True, index=df_all.index)
+    if selected_region != 'Todas':
+        mask &= df_all['region'].eq(selected_region)
+    if selected_state != 'Todos':
+        mask &= df_all['state'].eq(selected_state)
+    if selected_environment != 'Todos':
+        mask &= df_all['environment'].eq(selected_environment)
+    if selected_owner != 'Todos':
+        mask &= df_all['owner'].eq(selected_owner)
+    
+    # Tabela de instâncias
+    df_instances = build_table(df_all, INSTANCE_COLUMNS, mask)
+    if len(df_instances) > MAX_TABLE_ROWS and not st.toggle(f"Mostrar todas as {len(df_instances)} instâncias", key="show_all_instances"):
+        st.caption(f"Exibindo as primeiras {MAX_TABLE_ROWS} de {len(df_instances)} instâncias.")
+        df_instances = df_instances.head(MAX_TABLE_ROWS)
+    
+    st.dataframe(df_instances, use_container_width=True, hide_index=True)
+
+# TAB 5: Análise por Tags
+@st.fragment
+def render_tags_tab(collection_timestamp, df_all):
+    """Renderiza a aba de análise por tags"""
+    st.header("📊 Análise por Tags")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Distribuição por Environment")
+        if not df_all.empty:
+            st.plotly_chart(environment_fig(collection_timestamp, df_all), use_container_width=True, key="environment_bar")
+    
+    with col2:
+        st.subheader("Distribuição por CostCenter")
+        if not df_all.empty:
+            st.plotly_chart(cost_center_fig(collection_timestamp, df_all), use_container_width=True, key="cost_center_bar")
+        else:
+            st.info("Nenhum CostCenter encontrado.")
+    
+    st.subheader("Distribuição por Owner")
+    if not df_all.empty:
+        st.plotly_chart(owner_fig(collection_timestamp, df_all), use_container_width=True, key="owner_pie")
+
+# TAB 6: Relatórios
+@st.fragment
+def render_reports_tab(collection_timestamp, summary, data, df_all):
+    """Renderiza a aba de relatórios e exportação"""
+    st.header("📈 Relatórios e Exportação")
+    
+    # Resumo executivo
+    st.subheader("Resumo Executivo")
+    st.json(summary)
+    
+    # Exportar dados
+    st.subheader("Exportar Dados")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.download_button(
+            label="📥 Exportar CSV de Instâncias",
+            data=instances_csv(collection_timestamp, df_all),
+            file_name=f"aws_instances_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
+        )
+    
+    with col2:
+        st.download_button(
+            label="📥 Exportar JSON Completo",
+            data=full_json(collection_timestamp, data),
+            file_name=f"aws_finops_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json"
+        )
+
 def main():
+    inject_css()
     st.markdown('<div class="main-header">📊 AWS FinOps Audit Report</div>', unsafe_allow_html=True)
     
     data = load_data()
@@ -86,8 +513,8 @@ def main():
         st.write(f"**User:** {data.get('user_arn', 'N/A').split('/')[-1]}")
         
         if 'collection_timestamp' in data:
-            timestamp = datetime.fromisoformat(data['collection_timestamp'].replace('Z', '+00:00'))
-            st.write(f"**Última atualização:** {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+            timestamp = pd.Timestamp(data['collection_timestamp'])
+            st.write(f"**Última atualização:** {timestamp:%Y-%m-%d %H:%M:%S}")
         
         st.markdown("---")
         st.markdown("### 🔄 Atualizar Dados")
@@ -95,55 +522,19 @@ def main():
             st.info("Execute: ansible-playbook playbooks/finops_collect.yml")
     
     # Preparar dados agregados
-    all_instances = []
-    all_untagged = []
-    all_stopped = []
-    all_unused_volumes = []
-    all_unused_eips = []
-    
-    for region_data in data.get('regions', []):
-        region = region_data.get('region', 'unknown')
-        
-        # Instâncias
-        for instance in region_data.get('instances', {}).get('details', []):
-            instance['region'] = region
-            # Normalizar estado para lowercase
-            if 'state' in instance:
-                instance['state'] = instance['state'].lower()
-            all_instances.append(instance)
-        
-        # Recursos não taggeados
-        for instance in region_data.get('untagged_resources', {}).get('instances', []):
-            instance['region'] = region
-            if 'state' in instance:
-                instance['state'] = instance['state'].lower()
-            all_untagged.append(instance)
-        
-        # Instâncias paradas - usar filtro direto nas instâncias
-        for instance in region_data.get('instances', {}).get('details', []):
-            instance['region'] = region
-            if 'state' in instance:
-                instance['state'] = instance['state'].lower()
-            if instance.get('state') == 'stopped':
-                all_stopped.append(instance)
-        
-        # Volumes não utilizados
-        for volume in region_data.get('unused_volumes', {}).get('details', []):
-            volume['region'] = region
-            all_unused_volumes.append(volume)
-        
-        # EIPs não utilizados
-        for eip in region_data.get('unused_eips', {}).get('details', []):
-            eip['region'] = region
-            all_unused_eips.append(eip)
+    collection_timestamp = data.get('collection_timestamp')
+    df_all, df_untagged_all, df_stopped_all, df_volumes_all, df_eips_all = aggregate_data(
+        collection_timestamp, data
+    )
     
     # Métricas principais
     col1, col2, col3, col4 = st.columns(4)
     
-    total_instances = len(all_instances)
-    running_instances = len([i for i in all_instances if i.get('state', '').lower() == 'running'])
-    stopped_instances = len([i for i in all_instances if i.get('state', '').lower() == 'stopped'])
-    untagged_count = len(all_untagged)
+    total_instances = len(df_all)
+    state_counts = df_all['state'].value_counts()
+    running_instances = int(state_counts.get('running', 0))
+    stopped_instances = int(state_counts.get('stopped', 0))
+    untagged_count = len(df_untagged_all)
     
     with col1:
         st.metric("Total de Instâncias", total_instances)
@@ -153,11 +544,21 @@ def main():
         st.metric("Recursos Não Taggeados", untagged_count, 
                  delta="Crítico" if untagged_count > 0 else "OK", delta_color="inverse")
     with col4:
-        unused_volumes_count = len(all_unused_volumes)
-        unused_eips_count = len(all_unused_eips)
+        unused_volumes_count = len(df_volumes_all)
+        unused_eips_count = len(df_eips_all)
         total_cost_risks = stopped_instances + unused_volumes_count + unused_eips_count
         st.metric("Riscos de Custo", total_cost_risks)
     
+    summary = {
+        'Total de Instâncias': total_instances,
+        'Instâncias em Execução': running_instances,
+        'Instâncias Paradas': stopped_instances,
+        'Recursos Não Taggeados': untagged_count,
+        'Volumes Não Utilizados': unused_volumes_count,
+        'EIPs Não Utilizados': unused_eips_count,
+        'Total de Regiões': len(data.get('regions', []))
+    }
+    
     st.markdown("---")
     
     # Tabs para diferentes seções
@@ -172,355 +573,27 @@ def main():
     
     # TAB 1: Overview
     with tab1:
-        st.header("Visão Geral")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Instâncias por Região")
-            region_stats = {}
-            for region_data in data.get('regions', []):
-                region = region_data.get('region', 'unknown')
-                instances = region_data.get('instances', {})
-                region_stats[region] = {
-                    'running': instances.get('running', 0),
-                    'stopped': instances.get('stopped', 0),
-                    'total': instances.get('total', 0)
-                }
-            
-            if region_stats:
-                # Criar DataFrame corretamente
-                df_regions = pd.DataFrame([
-                    {
-                        'Região': region,
-                        'Em Execução': stats['running'],
-                        'Paradas': stats['stopped'],
-                        'Total': stats['total']
-                    }
-                    for region, stats in region_stats.items()
-                ])
-                
-                # Ordenar por total para melhor visualização
-                df_regions = df_regions.sort_values('Total', ascending=False)
-                
-                fig = px.bar(
-                    df_regions, 
-                    x='Região', 
-                    y=['Em Execução', 'Paradas'],
-                    title="Distribuição de Instâncias por Região",
-                    barmode='stack',
-                    color_discrete_map={'Em Execução': '#00cc00', 'Paradas': '#ff4444'},
-                    labels={'value': 'Quantidade', 'Região': 'Região AWS'}
-                )
-                # Rotacionar labels do eixo X para melhor visualização
-                fig.update_xaxes(tickangle=-45)
-                fig.update_layout(
-                    xaxis_title="Região AWS",
-                    yaxis_title="Quantidade de Instâncias",
-                    legend_title="Status"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("Nenhuma região encontrada com instâncias.")
-        
-        with col2:
-            st.subheader("Tipos de Instâncias")
-            instance_types = {}
-            for instance in all_instances:
-                itype = instance.get('instance_type', 'unknown')
-                instance_types[itype] = instance_types.get(itype, 0) + 1
-            
-            if instance_types:
-                df_types = pd.DataFrame(list(instance_types.items()), columns=['Tipo', 'Quantidade'])
-                df_types = df_types.sort_values('Quantidade', ascending=False).head(10)
-                
-                fig = px.pie(
-                    df_types, 
-                    values='Quantidade', 
-                    names='Tipo',
-                    title="Top 10 Tipos de Instâncias"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+        render_overview_tab(collection_timestamp, df_all)
     
     # TAB 2: Tagging Compliance
     with tab2:
-        st.header("🏷️ Tagging Compliance")
-        
-        if all_untagged:
-            st.markdown('<div class="warning-box">⚠️ Existem recursos sem tags obrigatórias!</div>', unsafe_allow_html=True)
-            
-            # Análise de tags ausentes
-            missing_tags_analysis = {
-                'Sem Name': [],
-                'Sem Owner': [],
-                'Sem CostCenter': [],
-                'Sem Environment': []
-            }
-            
-            for instance in all_instances:
-                tags = instance.get('tags', {})
-                if 'Name' not in tags or tags.get('Name') == 'N/A':
-                    missing_tags_analysis['Sem Name'].append(instance)
-                if 'owner' not in tags or tags.get('owner') == 'N/A':
-                    missing_tags_analysis['Sem Owner'].append(instance)
-                if 'CostCenter' not in tags or tags.get('CostCenter') == 'N/A':
-                    missing_tags_analysis['Sem CostCenter'].append(instance)
-                if 'Environment' not in tags or tags.get('Environment') == 'N/A':
-                    missing_tags_analysis['Sem Environment'].append(instance)
-            
-            cols = st.columns(4)
-            for idx, (tag_type, instances) in enumerate(missing_tags_analysis.items()):
-                with cols[idx]:
-                    st.metric(tag_type, len(instances))
-            
-            # Tabela de recursos não taggeados
-            st.subheader("Recursos Sem Tags Obrigatórias")
-            df_untagged = pd.DataFrame([
-                {
-                    'Instance ID': inst.get('instance_id', 'N/A'),
-                    'Nome': inst.get('name', 'N/A'),
-                    'Região': inst.get('region', 'N/A'),
-                    'Estado': inst.get('state', 'N/A'),
-                    'Tipo': inst.get('instance_type', 'N/A'),
-                    'Name Tag': '❌' if inst.get('name') == 'N/A' else '✅',
-                    'Owner Tag': '❌' if inst.get('owner') == 'N/A' else '✅',
-                    'CostCenter Tag': '❌' if inst.get('cost_center') == 'N/A' else '✅',
-                    'Environment Tag': '❌' if inst.get('environment') == 'N/A' else '✅'
-                }
-                for inst in all_untagged
-            ])
-            st.dataframe(df_untagged, use_container_width=True, hide_index=True)
-        else:
-            st.success("✅ Todos os recursos estão devidamente taggeados!")
+        render_tagging_tab(df_all, df_untagged_all)
     
     # TAB 3: Cost Optimization
     with tab3:
-        st.header("💰 Cost Optimization Opportunities")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("🛑 Instâncias Paradas")
-            if all_stopped:
-                st.warning(f"⚠️ {len(all_stopped)} instâncias paradas encontradas")
-                df_stopped = pd.DataFrame([
-                    {
-                        'Instance ID': inst.get('instance_id', 'N/A'),
-                        'Nome': inst.get('name', 'N/A'),
-                        'Região': inst.get('region', 'N/A'),
-                        'Tipo': inst.get('instance_type', 'N/A'),
-                        'Owner': inst.get('owner', 'N/A'),
-                        'CostCenter': inst.get('cost_center', 'N/A'),
-                        'Environment': inst.get('environment', 'N/A')
-                    }
-                    for inst in all_stopped
-                ])
-                st.dataframe(df_stopped, use_container_width=True, hide_index=True)
-            else:
-                st.success("✅ Nenhuma instância parada encontrada")
-        
-        with col2:
-            st.subheader("💾 Volumes Não Utilizados")
-            if all_unused_volumes:
-                total_size = sum(v.get('size', 0) for v in all_unused_volumes)
-                st.warning(f"⚠️ {len(all_unused_volumes)} volumes não utilizados ({total_size} GB)")
-                df_volumes = pd.DataFrame([
-                    {
-                        'Volume ID': vol.get('volume_id', 'N/A'),
-                        'Região': vol.get('region', 'N/A'),
-                        'Tamanho (GB)': vol.get('size', 0),
-                        'Tipo': vol.get('volume_type', 'N/A')
-                    }
-                    for vol in all_unused_volumes
-                ])
-                st.dataframe(df_volumes, use_container_width=True, hide_index=True)
-            else:
-                st.success("✅ Nenhum volume não utilizado encontrado")
-        
-        st.subheader("🌐 Elastic IPs Não Utilizados")
-        if all_unused_eips:
-            st.warning(f"⚠️ {len(all_unused_eips)} EIPs não utilizados")
-            df_eips = pd.DataFrame([
-                {
-                    'Allocation ID': eip.get('allocation_id', 'N/A'),
-                    'Public IP': eip.get('public_ip', 'N/A'),
-                    'Região': eip.get('region', 'N/A')
-                }
-                for eip in all_unused_eips
-            ])
-            st.dataframe(df_eips, use_container_width=True, hide_index=True)
-        else:
-            st.success("✅ Nenhum EIP não utilizado encontrado")
+        render_cost_tab(df_stopped_all, df_volumes_all, df_eips_all)
     
     # TAB 4: Instâncias
     with tab4:
-        st.header("🖥️ Detalhes das Instâncias")
-        
-        # Filtros
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            selected_region = st.selectbox(
-                "Filtrar por Região",
-                ['Todas'] + list(set(inst.get('region') for inst in all_instances))
-            )
-        
-        with col2:
-            selected_state = st.selectbox(
-                "Filtrar por Estado",
-                ['Todos', 'running', 'stopped', 'terminated']
-            )
-        
-        with col3:
-            selected_environment = st.selectbox(
-                "Filtrar por Environment",
-                ['Todos'] + list(set(inst.get('environment') for inst in all_instances if inst.get('environment') != 'N/A'))
-            )
-        
-        with col4:
-            selected_owner = st.selectbox(
-                "Filtrar por Owner",
-                ['Todos'] + list(set(inst.get('owner') for inst in all_instances if inst.get('owner') != 'N/A'))
-            )
-        
-        # Aplicar filtros
-        filtered_instances = all_instances
-        if selected_region != 'Todas':
-            filtered_instances = [i for i in filtered_instances if i.get('region') == selected_region]
-        if selected_state != 'Todos':
-            filtered_instances = [i for i in filtered_instances if i.get('state') == selected_state]
-        if selected_environment != 'Todos':
-            filtered_instances = [i for i in filtered_instances if i.get('environment') == selected_environment]
-        if selected_owner != 'Todos':
-            filtered_instances = [i for i in filtered_instances if i.get('owner') == selected_owner]
-        
-        # Tabela de instâncias
-        df_instances = pd.DataFrame([
-            {
-                'Instance ID': inst.get('instance_id', 'N/A'),
-                'Nome': inst.get('name', 'N/A'),
-                'Região': inst.get('region', 'N/A'),
-                'Estado': inst.get('state', 'N/A'),
-                'Tipo': inst.get('instance_type', 'N/A'),
-                'OS': inst.get('os', inst.get('platform', 'N/A')),
-                'Owner': inst.get('owner', 'N/A'),
-                'CostCenter': inst.get('cost_center', 'N/A'),
-                'Environment': inst.get('environment', 'N/A'),
-                'VPC ID': inst.get('vpc_id', 'N/A'),
-                'IP Privado': inst.get('private_ip', 'N/A'),
-                'IP Público': inst.get('public_ip', 'N/A')
-            }
-            for inst in filtered_instances
-        ])
-        
-        st.dataframe(df_instances, use_container_width=True, hide_index=True)
+        render_instances_tab(collection_timestamp, df_all)
     
     # TAB 5: Análise por Tags
     with tab5:
-        st.header("📊 Análise por Tags")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Distribuição por Environment")
-            env_counts = {}
-            for inst in all_instances:
-                env = inst.get('environment', 'N/A')
-                env_counts[env] = env_counts.get(env, 0) + 1
-            
-            if env_counts:
-                df_env = pd.DataFrame(list(env_counts.items()), columns=['Environment', 'Quantidade'])
-                fig = px.bar(df_env, x='Environment', y='Quantidade', 
-                           title="Instâncias por Environment")
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("Distribuição por CostCenter")
-            cc_counts = {}
-            for inst in all_instances:
-                cc = inst.get('cost_center', 'N/A')
-                if cc == 'N/A' or cc == '':
-                    cc = 'N/A'
-                cc_counts[cc] = cc_counts.get(cc, 0) + 1
-            
-            if cc_counts:
-                df_cc = pd.DataFrame(list(cc_counts.items()), columns=['CostCenter', 'Quantidade'])
-                # Ordenar por quantidade de forma decrescente
-                df_cc = df_cc.sort_values('Quantidade', ascending=False).head(10)
-                # Converter CostCenter para string para garantir que os labels sejam exibidos corretamente
-                df_cc['CostCenter'] = df_cc['CostCenter'].astype(str)
-                fig = px.bar(
-                    df_cc, 
-                    x='CostCenter', 
-                    y='Quantidade',
-                    title="Top 10 CostCenters",
-                    labels={'CostCenter': 'Cost Center', 'Quantidade': 'Quantidade de Instâncias'}
-                )
-                fig.update_xaxes(tickangle=-45)
-                fig.update_layout(
-                    xaxis_title="Cost Center",
-                    yaxis_title="Quantidade de Instâncias"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("Nenhum CostCenter encontrado.")
-        
-        st.subheader("Distribuição por Owner")
-        owner_counts = {}
-        for inst in all_instances:
-            owner = inst.get('owner', 'N/A')
-            owner_counts[owner] = owner_counts.get(owner, 0) + 1
-        
-        if owner_counts:
-            df_owner = pd.DataFrame(list(owner_counts.items()), columns=['Owner', 'Quantidade'])
-            df_owner = df_owner.sort_values('Quantidade', ascending=False)
-            fig = px.pie(df_owner, values='Quantidade', names='Owner',
-                        title="Instâncias por Owner")
-            st.plotly_chart(fig, use_container_width=True)
+        render_tags_tab(collection_timestamp, df_all)
     
     # TAB 6: Relatórios
     with tab6:
-        st.header("📈 Relatórios e Exportação")
-        
-        # Resumo executivo
-        st.subheader("Resumo Executivo")
-        
-        summary = {
-            'Total de Instâncias': total_instances,
-            'Instâncias em Execução': running_instances,
-            'Instâncias Paradas': stopped_instances,
-            'Recursos Não Taggeados': untagged_count,
-            'Volumes Não Utilizados': len(all_unused_volumes),
-            'EIPs Não Utilizados': len(all_unused_eips),
-            'Total de Regiões': len(data.get('regions', []))
-        }
-        
-        st.json(summary)
-        
-        # Exportar dados
-        st.subheader("Exportar Dados")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if st.button("📥 Exportar CSV de Instâncias"):
-                df_export = pd.DataFrame(all_instances)
-                csv = df_export.to_csv(index=False)
-                st.download_button(
-                    label="Baixar CSV",
-                    data=csv,
-                    file_name=f"aws_instances_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-        
-        with col2:
-            if st.button("📥 Exportar JSON Completo"):
-                json_str = json.dumps(data, indent=2, default=str)
-                st.download_button(
-                    label="Baixar JSON",
-                    data=json_str,
-                    file_name=f"aws_finops_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json"
-                )
+        render_reports_tab(collection_timestamp, summary, data, df_all)
 
 if __name__ == "__main__":
     main()